@@ -18,7 +18,7 @@ from envcloak.validation import (
     check_permissions,
     check_disk_space,
 )
-from envcloak.encryptor import decrypt_file
+from envcloak.encryptor import decrypt_file, decrypt_files
 from envcloak.exceptions import (
     OutputFileExistsException,
     DiskSpaceException,
@@ -138,6 +138,7 @@ def decrypt(
                 )
                 output_dir.mkdir(parents=True)
 
+            file_pairs = []
             for file in input_dir.iterdir():
                 if file.is_file() and file.suffix == ".enc":  # Only decrypt .enc files
                     output_file = output_dir / file.stem  # Remove .enc from filename
@@ -145,15 +146,14 @@ def decrypt(
                         f"Debug: Decrypting file {file} -> {output_file} using key {key_file}.",
                         debug,
                     )
-                    decrypt_file(
-                        str(file),
-                        str(output_file),
-                        key,
-                        validate_integrity=not skip_sha_validation,
-                    )
-                    click.echo(
-                        f"File {file} decrypted -> {output_file} using key {key_file}"
-                    )
+                    file_pairs.append((str(file), str(output_file)))
+
+            # Decrypt the batch concurrently on the library thread pool
+            decrypt_files(file_pairs, key, validate_integrity=not skip_sha_validation)
+            for input_path, output_path in file_pairs:
+                click.echo(
+                    f"File {input_path} decrypted -> {output_path} using key {key_file}"
+                )
     except (
         OutputFileExistsException,
         DiskSpaceException,
@@ -17,7 +17,7 @@ from envcloak.validation import (
     check_permissions,
     check_disk_space,
 )
-from envcloak.encryptor import encrypt_file
+from envcloak.encryptor import encrypt_file, encrypt_files
 from envcloak.exceptions import (
     OutputFileExistsException,
     DiskSpaceException,
@@ -135,6 +135,7 @@ def encrypt(input, directory, output, key_file, dry_run, force, debug):
                 )
                 output_dir.mkdir(parents=True)
 
+            file_pairs = []
             for file in input_dir.iterdir():
                 if file.is_file():  # Skip directories
                     output_file = output_dir / (file.name + ".enc")
@@ -142,10 +143,14 @@ def encrypt(input, directory, output, key_file, dry_run, force, debug):
                         f"Debug: Encrypting file {file} -> {output_file} using key {key_file}.",
                         debug,
                     )
-                    encrypt_file(str(file), str(output_file), key)
-                    click.echo(
-                        f"File {file} encrypted -> {output_file} using key {key_file}"
-                    )
+                    file_pairs.append((str(file), str(output_file)))
+
+            # Encrypt the batch concurrently on the library thread pool
+            encrypt_files(file_pairs, key)
+            for input_path, output_path in file_pairs:
+                click.echo(
+                    f"File {input_path} encrypted -> {output_path} using key {key_file}"
+                )
     except (
         OutputFileExistsException,
         DiskSpaceException,
@@ -2,6 +2,11 @@
 AES_BLOCK_SIZE = 128  # Block size for AES
 NONCE_SIZE = 12  # Recommended size for GCM nonce
 KEY_SIZE = 32  # 256-bit key
+GCM_TAG_SIZE = 16  # Size of the AES-GCM authentication tag
+
+# Integrity
+SHA_DIGEST_SIZE = 32  # Size of a SHA-256 / SHA3-256 digest
 
 # Key Derivation
 SALT_SIZE = 16  # Salt size for key derivation
+DEFAULT_ITERATIONS = 100000  # Default PBKDF2 iteration count
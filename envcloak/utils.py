@@ -71,3 +71,14 @@ def compute_sha256(data: str) -> str:
     :return: SHA-256 hash as a hex string.
     """
     return hashlib.sha3_256(data.encode()).hexdigest()
+
+
+def compute_sha256_bytes(data: bytes) -> str:
+    """
+    Compute SHA-256 hash of the given raw bytes, without a decode/encode
+    round trip through str.
+
+    :param data: Input data as bytes.
+    :return: SHA-256 hash as a hex string.
+    """
+    return hashlib.sha3_256(data).hexdigest()
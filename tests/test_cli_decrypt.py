@@ -103,7 +103,9 @@ def test_decrypt_with_force(mock_decrypt_file, runner, mock_files):
         assert f.read() == "DB_USERNAME=example_user\nDB_PASSWORD=example_pass"
 
 
-@patch("envcloak.commands.decrypt.decrypt_file")
+# Directory mode dispatches through decrypt_files, which resolves
+# decrypt_file in the encryptor module
+@patch("envcloak.encryptor.decrypt_file")
 def test_decrypt_with_force_directory(mock_decrypt_file, runner, isolated_mock_files):
     """
     Test the `decrypt` CLI command with the `--force` flag for a directory.
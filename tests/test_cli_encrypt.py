@@ -92,7 +92,9 @@ def test_encrypt_with_force(mock_encrypt_file, runner, isolated_mock_files):
         assert json.load(f)["ciphertext"] == "encrypted_data"
 
 
-@patch("envcloak.commands.encrypt.encrypt_file")
+# Directory mode dispatches through encrypt_files, which resolves
+# encrypt_file in the encryptor module
+@patch("envcloak.encryptor.encrypt_file")
 def test_encrypt_with_force_directory(mock_encrypt_file, runner, isolated_mock_files):
     """
     Test the `encrypt` CLI command with the `--force` flag for a directory.
@@ -1,18 +1,28 @@
 import os
 import base64
+import hashlib
 import json
 import pytest
 from pathlib import Path
 from envcloak.encryptor import (
     derive_key,
+    autotune_iterations,
     generate_salt,
     encrypt,
     decrypt,
     encrypt_file,
     decrypt_file,
+    encrypt_file_binary,
+    decrypt_file_binary,
+    encrypt_files,
+    decrypt_files,
+    encrypt_msgpack,
+    decrypt_msgpack,
+    msgpack,
+    _pbkdf2_sha256_block,
 )
-from envcloak.exceptions import InvalidSaltException
-from envcloak.constants import SALT_SIZE, KEY_SIZE, NONCE_SIZE
+from envcloak.exceptions import InvalidSaltException, FileDecryptionException
+from envcloak.constants import SALT_SIZE, KEY_SIZE, NONCE_SIZE, DEFAULT_ITERATIONS
 
 
 def test_generate_salt():
@@ -35,6 +45,50 @@ def test_derive_key():
     assert isinstance(key, bytes)
 
 
+def test_derive_key_is_cached():
+    """
+    Test that derive_key caches the derived key for a (password, salt) pair.
+    """
+    password = "test_password"
+    salt = generate_salt()
+    first = derive_key(password, salt)
+    second = derive_key(password, salt)
+    assert first is second  # Cache hit returns the same object
+
+
+def test_derive_key_custom_iterations():
+    """
+    Test that different iteration counts produce different keys.
+    """
+    password = "test_password"
+    salt = generate_salt()
+    default_key = derive_key(password, salt)
+    stronger_key = derive_key(password, salt, iterations=DEFAULT_ITERATIONS * 2)
+    assert default_key != stronger_key
+
+
+def test_autotune_iterations():
+    """
+    Test that autotune_iterations returns at least the default count.
+    """
+    tuned = autotune_iterations(target_ms=50)
+    assert isinstance(tuned, int)
+    assert tuned >= DEFAULT_ITERATIONS
+
+
+def test_pbkdf2_block_matches_hashlib():
+    """
+    Test that per-block PBKDF2 computation matches hashlib's reference output.
+    """
+    password = b"test_password"
+    salt = os.urandom(SALT_SIZE)
+    iterations = 1000
+    concatenated = b"".join(
+        _pbkdf2_sha256_block(password, salt, iterations, i) for i in (1, 2)
+    )
+    assert concatenated == hashlib.pbkdf2_hmac("sha256", password, salt, iterations, 64)
+
+
 def test_derive_key_invalid_salt():
     """
     Test that derive_key raises an InvalidSaltException for invalid salt sizes.
@@ -146,6 +200,163 @@ def test_decrypt_file(tmp_files):
     assert decrypted_text == plaintext_file.read_text()
 
 
+def _write_legacy_envelope(path, plaintext, key):
+    """
+    Write an envelope the way the pre-streaming encryptor did: file_sha is
+    the hash of the serialized payload without the file_sha field, and the
+    file is dumped with json's default separators.
+    """
+    encrypted_data = encrypt(plaintext, key)
+    encrypted_data["sha"] = hashlib.sha3_256(plaintext.encode()).hexdigest()
+    encrypted_data["file_sha"] = hashlib.sha3_256(
+        json.dumps(encrypted_data, ensure_ascii=False).encode()
+    ).hexdigest()
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(encrypted_data, f, ensure_ascii=False)
+    return encrypted_data
+
+
+def test_decrypt_file_legacy_envelope(tmp_path):
+    """
+    Test that a legacy envelope still passes integrity validation.
+    """
+    key = os.urandom(KEY_SIZE)
+    plaintext = "LEGACY_VAR=legacy_value"
+    encrypted_file = tmp_path / "legacy.enc"
+    decrypted_file = tmp_path / "legacy.env"
+
+    _write_legacy_envelope(encrypted_file, plaintext, key)
+    decrypt_file(encrypted_file, decrypted_file, key, validate_integrity=True)
+
+    assert decrypted_file.read_text() == plaintext
+
+
+def test_decrypt_file_interim_envelope(tmp_path):
+    """
+    Test that an envelope whose file_sha hashes the raw nonce, tag and
+    ciphertext (the unversioned interim layout) still passes validation.
+    """
+    key = os.urandom(KEY_SIZE)
+    plaintext = "INTERIM_VAR=interim_value"
+    encrypted_file = tmp_path / "interim.enc"
+    decrypted_file = tmp_path / "interim.env"
+
+    encrypted_data = encrypt(plaintext, key)
+    encrypted_data["sha"] = hashlib.sha3_256(plaintext.encode()).hexdigest()
+    hasher = hashlib.sha3_256()
+    hasher.update(base64.b64decode(encrypted_data["nonce"]))
+    hasher.update(base64.b64decode(encrypted_data["tag"]))
+    hasher.update(base64.b64decode(encrypted_data["ciphertext"]))
+    encrypted_data["file_sha"] = hasher.hexdigest()
+    with open(encrypted_file, "w", encoding="utf-8") as f:
+        json.dump(encrypted_data, f, ensure_ascii=False)
+
+    decrypt_file(encrypted_file, decrypted_file, key, validate_integrity=True)
+
+    assert decrypted_file.read_text() == plaintext
+
+
+def test_decrypt_file_tampered_legacy_envelope(tmp_path):
+    """
+    Test that a tampered legacy envelope fails integrity validation.
+    """
+    key = os.urandom(KEY_SIZE)
+    plaintext = "LEGACY_VAR=legacy_value"
+    encrypted_file = tmp_path / "legacy.enc"
+    decrypted_file = tmp_path / "legacy.env"
+
+    encrypted_data = _write_legacy_envelope(encrypted_file, plaintext, key)
+
+    # Flip a character of the stored plaintext hash
+    sha = encrypted_data["sha"]
+    tampered_sha = ("0" if sha[0] != "0" else "1") + sha[1:]
+    raw = encrypted_file.read_text(encoding="utf-8")
+    encrypted_file.write_text(raw.replace(sha, tampered_sha), encoding="utf-8")
+
+    with pytest.raises(FileDecryptionException):
+        decrypt_file(encrypted_file, decrypted_file, key, validate_integrity=True)
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+def test_encrypt_and_decrypt_msgpack():
+    """
+    Test that the msgpack envelope round trip preserves the plaintext.
+    """
+    key = os.urandom(KEY_SIZE)
+    plaintext = "This is a test message."
+
+    blob = encrypt_msgpack(plaintext, key)
+    assert isinstance(blob, bytes)
+    assert b"ciphertext" not in blob  # Compact keys, no base64/JSON envelope
+
+    decrypted = decrypt_msgpack(blob, key, validate_integrity=True)
+    assert decrypted == plaintext.encode()
+
+
+@pytest.mark.skipif(msgpack is None, reason="msgpack is not installed")
+def test_decrypt_msgpack_invalid_key():
+    """
+    Test that decrypting a msgpack envelope with the wrong key fails.
+    """
+    key = os.urandom(KEY_SIZE)
+    wrong_key = os.urandom(KEY_SIZE)
+
+    blob = encrypt_msgpack("This is a test message.", key)
+    with pytest.raises(Exception):
+        decrypt_msgpack(blob, wrong_key)
+
+
+def test_encrypt_and_decrypt_files_batch(tmp_path):
+    """
+    Test encrypting and decrypting a batch of files via the thread pool.
+    """
+    key = os.urandom(KEY_SIZE)
+    encrypt_pairs = []
+    decrypt_pairs = []
+    for i in range(4):
+        plaintext_file = tmp_path / f"plain_{i}.env"
+        plaintext_file.write_text(f"VAR_{i}=value_{i}")
+        encrypted_file = tmp_path / f"encrypted_{i}.enc"
+        decrypted_file = tmp_path / f"decrypted_{i}.env"
+        encrypt_pairs.append((str(plaintext_file), str(encrypted_file)))
+        decrypt_pairs.append((str(encrypted_file), str(decrypted_file)))
+
+    encrypt_files(encrypt_pairs, key, workers=2)
+    decrypt_files(decrypt_pairs, key, validate_integrity=True, workers=2)
+
+    for i in range(4):
+        assert (tmp_path / f"decrypted_{i}.env").read_text() == f"VAR_{i}=value_{i}"
+
+
+def test_encrypt_and_decrypt_file_binary(tmp_files):
+    """
+    Test the binary container round trip.
+    """
+    plaintext_file, encrypted_file, decrypted_file = tmp_files
+    key = os.urandom(KEY_SIZE)
+
+    encrypt_file_binary(plaintext_file, encrypted_file, key)
+
+    # Verify the container starts with the magic bytes, not JSON
+    assert encrypted_file.read_bytes().startswith(b"ENVC1")
+
+    decrypt_file_binary(encrypted_file, decrypted_file, key)
+    assert decrypted_file.read_text() == plaintext_file.read_text()
+
+
+def test_decrypt_file_binary_bad_magic(tmp_files):
+    """
+    Test that decrypting a non-container file raises an error.
+    """
+    _, encrypted_file, decrypted_file = tmp_files
+    key = os.urandom(KEY_SIZE)
+
+    encrypted_file.write_bytes(b"not a binary container at all, just bytes" * 3)
+
+    with pytest.raises(Exception):
+        decrypt_file_binary(encrypted_file, decrypted_file, key)
+
+
 def test_encrypt_and_decrypt_file_invalid_key(tmp_files):
     """
     Test decrypting a file with an invalid key.
@@ -54,7 +54,9 @@ def test_encrypt_invalid_key():
     data = "Sensitive data"
     invalid_key = os.urandom(KEY_SIZE - 1)  # Key must be 32 bytes
 
-    with pytest.raises(EncryptionException, match="Invalid key size"):
+    with pytest.raises(
+        EncryptionException, match="AESGCM key must be 128, 192, or 256 bits"
+    ):
         encrypt(data, invalid_key)
 
 
@@ -97,6 +99,8 @@ def test_decrypt_file_invalid_content(tmp_path):
 
     with pytest.raises(
         FileDecryptionException,
-        match=r"Error: Failed to decrypt the file\.\nDetails: Expecting value: line 1 column 1 \(char 0\)",
+        # Message depends on the JSON parser: stdlib says "Expecting value",
+        # orjson says "invalid literal"
+        match=r"Error: Failed to decrypt the file\.\nDetails: (Expecting value|invalid literal): line 1 column 1 \(char 0\)",
     ):
         decrypt_file(str(input_file), str(output_file), key)